@@ -1,16 +1,315 @@
 #!/usr/bin/env python3
 
 import argparse
+import atexit
+import functools
+import json
 import subprocess
 import os
 import time
 import sys
-import glob
 import re
-import gzip
+import mmap
+import select
+import zlib
+import itertools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Tuple, Dict
 
+# Patterns used by parse_build_log, compiled once instead of on every log line
+_SOURCE_EXT = r'(?:swift|c(?:pp)?|h|mm?)'
+_ERR_RE = re.compile(r'(/[^:]+\.' + _SOURCE_EXT + r'):\d+:\d+.*?error:\s*(.+)', re.IGNORECASE)
+_SIMPLE_ERR_RE = re.compile(r'(/[^:]+\.' + _SOURCE_EXT + r'):(.+)', re.IGNORECASE)
+_SWIFT_LOC_RE = re.compile(r'(/[^:]+\.swift):\d+:\d+\s+')
+_SWIFT_RE = re.compile(r'(/[^:]+\.swift):(\d+):(\d+)\s+(.+)')
+_OBJC_LOC_RE = re.compile(r'(/[^:]+\.mm?):\d+:\d+\s+')
+_OBJC_RE = re.compile(r'(/[^:]+\.mm?):(\d+):(\d+)\s+(.+)')
+_WARNING_RE = re.compile(r'(/[^:]+\.' + _SOURCE_EXT + r'):\d+:\d+.*?warning:\s*(.+)', re.IGNORECASE)
+_NOTE_RE = re.compile(r'note:\s*(.+)', re.IGNORECASE)
+_QUOTED_RE = re.compile(r'.*"([^"]+)".*')
+# The build's result string ("Build succeeded ...", "Build failed ...") as an SLF string token,
+# written after the diagnostics it summarizes
+_BUILD_RESULT_RE = re.compile(rb'\d+"Build (?:succeeded|failed)')
+
+# Logs larger than this (compressed) are scanned across several processes
+_PARALLEL_MIN_LOG_SIZE = 16 << 20
+_PARALLEL_BATCH_LINES = 10000
+# Compressed bytes handed to zlib per step when inflating a build log
+_INFLATE_CHUNK_SIZE = 256 << 10
+# Log text separates lines with '\r' as well as '\n'; split like universal newlines do
+_LINE_BREAK_RE = re.compile(rb'\r\n?|\n')
+
+# Marker file whose mtime records the last time accessibility permissions were confirmed
+_ACCESSIBILITY_CACHE_FILE = Path.home() / ".cache" / "xcode_remote" / "acc_ok"
+_ACCESSIBILITY_CACHE_TTL = 60 * 60
+
+# Message fragments that mark a located Swift / Objective-C line as an error
+_ERROR_HINTS = {
+    "swift": (
+        'cannot override', 'ambiguous use', 'overriding declaration', 'overriding property must be',
+        'conflicts with', 'must be unwrapped', 'requires an \'override\' keyword',
+        'getter for', 'setter for', 'value of optional type'
+    ),
+    "objc": (
+        'property', 'not found', 'no visible @interface', 'declares the selector'
+    ),
+}
+
+def _has_error_hint(lowered_line: str, category: str) -> bool:
+    """Check whether a lowercased log line contains one of the error hints for category"""
+    return any(hint in lowered_line for hint in _ERROR_HINTS[category])
+
+def _iter_log_lines(log_path: Path):
+    """Yield the lines of a gzipped xcactivitylog, inflating it straight from an mmap of the file"""
+    # gzip.open does member framing and CRC checks in Python; raw inflate with zlib skips all of that
+    with open(log_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # Xcode writes each log as a single gzip member, as _log_is_complete also assumes
+            if data[:2] != b'\x1f\x8b':
+                raise OSError(f"Not a gzipped file: {log_path}")
+            offset = _skip_gzip_header(data, 0)
+            inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+            carry = b''
+            while not inflater.eof and offset < len(data):
+                chunk = data[offset:offset + _INFLATE_CHUNK_SIZE]
+                offset += len(chunk)
+                inflated = carry + inflater.decompress(chunk)
+                # Hold back a trailing '\r' in case the next chunk starts with the '\n' of a '\r\n'
+                held = b'\r' if inflated.endswith(b'\r') else b''
+                lines = _LINE_BREAK_RE.split(inflated[:len(inflated) - len(held)])
+                carry = lines.pop() + held
+                yield from lines
+            # A stream without its end is most likely still being written; stop at what's there
+            if carry.endswith(b'\r'):
+                yield carry[:-1]
+            elif carry:
+                yield carry
+
+def _skip_gzip_header(data, offset: int) -> int:
+    """Return the offset of the deflate stream following the gzip member header at offset"""
+    flags = data[offset + 3]
+    offset += 10
+    if flags & 0x04:  # FEXTRA
+        offset += 2 + int.from_bytes(data[offset:offset + 2], 'little')
+    if flags & 0x08:  # FNAME
+        offset = data.find(b'\0', offset) + 1
+    if flags & 0x10:  # FCOMMENT
+        offset = data.find(b'\0', offset) + 1
+    if flags & 0x02:  # FHCRC
+        offset += 2
+    return offset
+
+def _scan_log_lines(raw_lines, result: Dict[str, dict]) -> bool:
+    """Scan raw xcactivitylog lines, adding errors, warnings and notes to result. Returns True if the build's result record was reached"""
+    for raw_line in raw_lines:
+        # Nothing after the build's result record is worth scanning
+        finished = b'"Build ' in raw_line and _BUILD_RESULT_RE.search(raw_line)
+        # Most of the log is binary noise: skip it before paying for decoding or regexes.
+        # Every other token below contains a colon, so lines without one aren't even lowercased
+        if b':' not in raw_line and not finished:
+            continue
+        lowered = raw_line.lower()
+        has_error = b'error:' in lowered
+        has_swift = b'.swift:' in raw_line
+        has_objc = b'.m:' in raw_line or b'.mm:' in raw_line
+        if not (has_error or has_swift or has_objc or finished or b'warning:' in lowered or b'note:' in lowered):
+            continue
+        line = raw_line.decode('utf-8', 'ignore')
+        
+        # Standard error format with explicit "error:"
+        if has_error:
+            file_error_match = _ERR_RE.search(line)
+            if file_error_match:
+                error_msg = f"{file_error_match.group(1)}:{file_error_match.group(2).strip()}"
+                result["errors"].setdefault(error_msg, None)
+            else:
+                # Handle simple error format for Swift and ObjC files: /path/file.ext:error message
+                simple_error_match = _SIMPLE_ERR_RE.search(line)
+                if simple_error_match:
+                    file_path = simple_error_match.group(1)
+                    message_part = simple_error_match.group(2)
+                    # Clean up the message - extract just the error after the last file path
+                    _, sep, tail = message_part.rpartition(file_path + ':')
+                    if sep and tail:
+                        clean_message = tail.strip()
+                    else:
+                        # Fallback: just take everything after the colon, clean up quotes
+                        clean_message = message_part.strip()
+                        clean_message = _QUOTED_RE.sub(r'\1', clean_message)
+                        if '"' not in clean_message:  # If no quotes found, keep original
+                            clean_message = message_part.strip()
+                    if clean_message:
+                        result["errors"].setdefault(f"{file_path}:{clean_message}", None)
+        
+        # Swift compilation errors that don't use "error:" prefix (but limit processing)
+        elif has_swift and len(line) < 1000 and _SWIFT_LOC_RE.search(line):
+            # Check if this looks like a Swift error (common patterns)
+            if _has_error_hint(line.lower(), "swift"):
+                swift_match = _SWIFT_RE.search(line)
+                if swift_match:
+                    file_path, line_num, col_num, message = swift_match.groups()
+                    clean_message = message.strip()[:200]  # Limit message length
+                    result["errors"].setdefault(f"{file_path}:{line_num}:{col_num} {clean_message}", None)
+        
+        # Objective-C errors (but limit processing)
+        elif has_objc and len(line) < 1000 and _OBJC_LOC_RE.search(line):
+            if _has_error_hint(line.lower(), "objc"):
+                objc_match = _OBJC_RE.search(line)
+                if objc_match:
+                    file_path, line_num, col_num, message = objc_match.groups()
+                    clean_message = message.strip()[:200]  # Limit message length
+                    result["errors"].setdefault(f"{file_path}:{line_num}:{col_num} {clean_message}", None)
+        
+        # Warning format
+        elif b'warning:' in lowered:
+            file_warning_match = _WARNING_RE.search(line)
+            if file_warning_match:
+                warning_msg = f"{file_warning_match.group(1)}:{file_warning_match.group(2).strip()}"
+                result["warnings"].setdefault(warning_msg, None)
+        
+        # Note format
+        elif b'note:' in lowered:
+            note_match = _NOTE_RE.search(line)
+            if note_match:
+                result["notes"].setdefault(note_match.group(1).strip(), None)
+        
+        if finished:
+            return True
+    return False
+
+def _scan_log_batch(raw_lines: List[bytes]) -> Tuple[Dict[str, dict], bool]:
+    """Scan one batch of log lines in a worker process"""
+    result = {"errors": {}, "warnings": {}, "notes": {}}
+    finished = _scan_log_lines(raw_lines, result)
+    return result, finished
+
+def _scan_log_parallel(raw_lines, result: Dict[str, dict]) -> bool:
+    """Scan log lines in batches across worker processes, merging their findings into result. Returns True if the build's result record was reached"""
+    with ProcessPoolExecutor() as executor:
+        # Keep only a few batches in flight so the log is still streamed rather than read up front
+        max_pending = 2 * (os.cpu_count() or 1)
+        pending = deque()
+        batches = iter(lambda: list(itertools.islice(raw_lines, _PARALLEL_BATCH_LINES)), [])
+        for batch in itertools.chain(batches, [None]):
+            if batch is not None:
+                pending.append(executor.submit(_scan_log_batch, batch))
+            while pending and (batch is None or len(pending) >= max_pending):
+                # Merge in log order; once a batch reaches the result record, later batches
+                # are dropped so the output matches a serial scan
+                found, finished = pending.popleft().result()
+                for key, entries in found.items():
+                    result[key].update(entries)
+                if finished:
+                    for future in pending:
+                        future.cancel()
+                    return True
+    return False
+
+def _frontmost_app_name() -> Optional[str]:
+    """Name of the frontmost application, asked of AppKit in-process when pyobjc is available"""
+    # Imported here so CLI startup and worker processes don't pay for loading AppKit
+    try:
+        from AppKit import NSWorkspace
+    except ImportError:
+        return None
+    app = NSWorkspace.sharedWorkspace().frontmostApplication()
+    name = app.localizedName() if app else None
+    return str(name) if name else None
+
+# JavaScript for Automation loop run by one long-lived osascript process. It reads one
+# JSON-encoded AppleScript source per line from stdin, runs it with NSAppleScript and
+# answers with one JSON line, so each script doesn't pay for spawning a new osascript
+_APPLESCRIPT_SERVER = r"""
+ObjC.import('Foundation');
+const input = $.NSFileHandle.fileHandleWithStandardInput;
+const output = $.NSFileHandle.fileHandleWithStandardOutput;
+function reply(message) {
+    output.writeData($(JSON.stringify(message) + '\n').dataUsingEncoding($.NSUTF8StringEncoding));
+}
+let pending = '';
+while (true) {
+    const data = input.availableData;
+    if (data.length == 0) break;
+    pending += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+    let newline;
+    while ((newline = pending.indexOf('\n')) >= 0) {
+        const source = JSON.parse(pending.slice(0, newline));
+        pending = pending.slice(newline + 1);
+        const error = Ref();
+        const result = $.NSAppleScript.alloc.initWithSource(source).executeAndReturnError(error);
+        if (result.isNil()) {
+            const info = ObjC.deepUnwrap(error[0]) || {};
+            reply({ok: false, error: `execution error: ${info.NSAppleScriptErrorMessage || 'unknown error'} (${info.NSAppleScriptErrorNumber})`});
+        } else {
+            reply({ok: true, output: ObjC.unwrap(result.stringValue) || ''});
+        }
+    }
+}
+"""
+
+_applescript_server: Optional[subprocess.Popen] = None
+
+def _stop_applescript_server():
+    """Shut down the shared osascript process, if one was started"""
+    global _applescript_server
+    if _applescript_server and _applescript_server.poll() is None:
+        _applescript_server.stdin.close()
+        _applescript_server.wait()
+    _applescript_server = None
+
+atexit.register(_stop_applescript_server)
+
+def _run_applescript(source: str, timeout: Optional[float] = None) -> str:
+    """Run AppleScript in the shared osascript process and return its result as text"""
+    # Failures raise CalledProcessError / TimeoutExpired, like subprocess.run(check=True) did;
+    # AppleScript errors carry osascript's "execution error: ..." text in stderr
+    global _applescript_server
+    if _applescript_server is None or _applescript_server.poll() is not None:
+        _applescript_server = subprocess.Popen(['osascript', '-l', 'JavaScript', '-e', _APPLESCRIPT_SERVER],
+                                               stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                               text=True, encoding='utf-8')
+    server = _applescript_server
+    
+    try:
+        server.stdin.write(json.dumps(source) + '\n')
+        server.stdin.flush()
+    except BrokenPipeError:
+        _applescript_server = None
+        raise subprocess.CalledProcessError(server.wait(), 'osascript')
+    
+    if timeout is not None and not select.select([server.stdout], [], [], timeout)[0]:
+        # The script is stuck, so the whole process has to go
+        server.kill()
+        server.wait()
+        _applescript_server = None
+        raise subprocess.TimeoutExpired('osascript', timeout)
+    
+    line = server.stdout.readline()
+    if not line:
+        _applescript_server = None
+        raise subprocess.CalledProcessError(server.wait(), 'osascript')
+    
+    response = json.loads(line)
+    if not response['ok']:
+        raise subprocess.CalledProcessError(1, 'osascript', stderr=response['error'])
+    return response['output']
+
+def _newest_entry(directory: Path, name_filter) -> Optional[os.DirEntry]:
+    """Most recently modified entry of directory whose name passes name_filter, via a single scandir pass"""
+    # scandir hands back names without building Path objects, and each DirEntry caches its own stat
+    try:
+        with os.scandir(directory) as entries:
+            matches = [e for e in entries if name_filter(e.name)]
+            if matches:
+                return max(matches, key=lambda e: e.stat(follow_symlinks=False).st_mtime)
+    except OSError:
+        pass
+    return None
+
 class XcodeRemote:
     def __init__(self, project_path: str):
         self.project_path = Path(project_path).resolve()
@@ -19,47 +318,55 @@ class XcodeRemote:
         
         self.project_name = self.project_path.stem
         self.derived_data_path = Path.home() / "Library/Developer/Xcode/DerivedData"
+        self._derived_data_cache: Optional[Path] = None
+        self._logs_dir: Optional[Path] = None
+        # (log path, (inode, mtime, size) at last read, bytes consumed, decompressor) used to
+        # detect the end of the log being written
+        self._log_inflater: Optional[Tuple[Path, Optional[Tuple[int, int, int]], int, object]] = None
         
     def find_project_derived_data(self) -> Optional[Path]:
         """Find the DerivedData directory for this project"""
-        pattern = f"{self.project_name}-*"
-        matches = list(self.derived_data_path.glob(pattern))
-        if matches:
-            return max(matches, key=lambda p: p.stat().st_mtime)
-        return None
+        # The project's DerivedData directory doesn't change during a run, so only look it up
+        # again if it disappears (e.g. DerivedData was cleaned)
+        if self._derived_data_cache and self._derived_data_cache.exists():
+            return self._derived_data_cache
+        
+        prefix = f"{self.project_name}-"
+        newest = _newest_entry(self.derived_data_path, lambda name: name.startswith(prefix))
+        if not newest:
+            return None
+        self._derived_data_cache = Path(newest.path)
+        return self._derived_data_cache
     
     def get_latest_build_log(self) -> Optional[Path]:
         """Get the most recent build log for the project"""
-        derived_data = self.find_project_derived_data()
-        if not derived_data:
-            return None
-            
-        logs_dir = derived_data / "Logs" / "Build"
-        if not logs_dir.exists():
-            return None
+        latest = self._find_latest_build_log()
+        return latest[0] if latest else None
+    
+    def _find_latest_build_log(self) -> Optional[Tuple[Path, float]]:
+        """Get the most recent build log for the project along with its mtime"""
+        # The logs directory doesn't move during a run, so only resolve it again if it
+        # disappears (e.g. DerivedData was cleaned). The DerivedData lookup is redone with
+        # it, since a recreated project folder may get a different name
+        if self._logs_dir is None or not self._logs_dir.exists():
+            if self._logs_dir is not None:
+                self._derived_data_cache = None
+            self._logs_dir = None
+            derived_data = self.find_project_derived_data()
+            if not derived_data:
+                return None
+                
+            logs_dir = derived_data / "Logs" / "Build"
+            if not logs_dir.exists():
+                return None
+            self._logs_dir = logs_dir
             
-        log_files = list(logs_dir.glob("*.xcactivitylog"))
-        if log_files:
-            return max(log_files, key=lambda p: p.stat().st_mtime)
+        newest = _newest_entry(self._logs_dir, lambda name: name.endswith(".xcactivitylog"))
+        if newest:
+            # DirEntry caches its stat result, so this doesn't stat the log again
+            return Path(newest.path), newest.stat(follow_symlinks=False).st_mtime
         return None
     
-    def open_project_in_xcode(self) -> bool:
-        """Open the project in Xcode using AppleScript"""
-        applescript = f'''
-        tell application "Xcode"
-            activate
-            open "{self.project_path}"
-        end tell
-        '''
-        
-        try:
-            subprocess.run(['osascript', '-e', applescript], check=True)
-            time.sleep(2)  # Give Xcode time to open
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"Error opening project in Xcode: {e}")
-            return False
-    
     def trigger_build(self, action: str = "build", target: Optional[str] = None) -> bool:
         """Trigger a build action in Xcode using AppleScript"""
         if action == "build":
@@ -70,158 +377,217 @@ class XcodeRemote:
             print(f"Unknown action: {action}")
             return False
         
-        # Simple approach: activate Xcode, trigger build, then Cmd+Tab back
+        # Without pyobjc the frontmost app has to come from a System Events round-trip instead
+        front_app = _frontmost_app_name()
+        if front_app is not None:
+            escaped_name = front_app.replace('\\', '\\\\').replace('"', '\\"')
+            get_front_app = f'set frontApp to "{escaped_name}"'
+        else:
+            get_front_app = '''tell application "System Events"
+            set frontApp to name of first application process whose frontmost is true
+        end tell'''
+        
+        # One osascript run: remember the frontmost app, bring Xcode forward (opening the
+        # project if it wasn't already in front), send the shortcut, then Cmd+Tab back
         applescript = f'''
+        {get_front_app}
+        
         tell application "Xcode"
             activate
+            if frontApp is not "Xcode" then
+                set projectDocument to open "{self.project_path}"
+                try
+                    repeat 200 times
+                        if loaded of projectDocument then exit repeat
+                        delay 0.05
+                    end repeat
+                end try
+            end if
         end tell
         
-        delay 0.1
-        
         tell application "System Events"
+            repeat 200 times
+                if frontmost of application process "Xcode" then exit repeat
+                delay 0.01
+            end repeat
             keystroke "{keystroke_cmd}" using {{command down}}
+            if frontApp is not "Xcode" then
+                keystroke tab using {{command down}}
+            end if
         end tell
         
-        delay 0.1
-        
-        tell application "System Events"
-            keystroke tab using {{command down}}
-        end tell
+        return frontApp
         '''
         
         try:
-            subprocess.run(['osascript', '-e', applescript], check=True)
+            front_app = _run_applescript(applescript)
+            if front_app.strip() != "Xcode":
+                print(f"Opened project: {self.project_path}")
             return True
         except subprocess.CalledProcessError as e:
-            print(f"Error triggering {action}: {e}")
+            print(f"Error triggering {action}: {e.stderr or e}")
             print("Note: You may need to grant Terminal accessibility permissions in System Preferences > Security & Privacy > Privacy > Accessibility")
             return False
     
-    def wait_for_build_completion(self, timeout: int = 300) -> Tuple[bool, bool]:
-        """Wait for build completion by monitoring DerivedData. Returns (completed, success)"""
+    def wait_for_build_completion(self, timeout: int = 300) -> Tuple[bool, bool, Optional[Path], Optional[Dict[str, List[str]]]]:
+        """Wait for build completion by monitoring DerivedData. Returns (completed, success, log_path, results)"""
         initial_log = self.get_latest_build_log()
         initial_time = time.time()
+        # Never carry completion state over from an earlier build of the same log path
+        self._log_inflater = None
         
         print("Waiting for build to start...")
         
         # Wait for a new log file to appear or existing one to be modified
         start_time = time.time()
         while time.time() - start_time < timeout:
-            current_log = self.get_latest_build_log()
+            current = self._find_latest_build_log()
             
-            if current_log and (not initial_log or current_log != initial_log or 
-                               current_log.stat().st_mtime > initial_time):
+            if current and (not initial_log or current[0] != initial_log or current[1] > initial_time):
+                current_log = current[0]
                 print("Build started, waiting for completion...")
                 break
             
             time.sleep(1)
         else:
             print("Timeout waiting for build to start")
-            return False, False
+            return False, False, None, None
         
         # Now wait for the build to finish (log file stops being modified)
+        deadline = start_time + timeout
+        if hasattr(select, 'kqueue'):
+            try:
+                finished_log = self._wait_for_quiet_log(current_log, deadline)
+            except OSError:
+                # The log couldn't be watched, fall back to polling
+                finished_log = self._poll_for_quiet_log(deadline)
+        else:
+            finished_log = self._poll_for_quiet_log(deadline)
+        
+        if not finished_log:
+            print("Timeout waiting for build completion")
+            return False, False, None, None
+        
+        print("Build completed")
+        # Check if build was successful by parsing the log
+        results = self.parse_build_log(finished_log)
+        build_success = len(results["errors"]) == 0
+        return True, build_success, finished_log, results
+    
+    def _wait_for_quiet_log(self, log_path: Path, deadline: float, quiet_period: float = 2.0) -> Optional[Path]:
+        """Block on kqueue until the build log is complete or has had no writes for quiet_period seconds. Returns the log, or None on timeout"""
+        watch_flags = (select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND |
+                       select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME)
+        open_flags = getattr(os, 'O_EVTONLY', os.O_RDONLY)
+        kq = select.kqueue()
+        fds = []
+        try:
+            while True:
+                # Watch the logs directory (new logs appear there) and the current log itself
+                for fd in fds:
+                    os.close(fd)
+                fds = []
+                if self._logs_dir is None:
+                    # The logs directory vanished while re-resolving; the caller falls back to polling
+                    raise FileNotFoundError("Build logs directory no longer exists")
+                fds.append(os.open(str(self._logs_dir), open_flags))
+                fds.append(os.open(str(log_path), open_flags))
+                kq.control([select.kevent(fd, filter=select.KQ_FILTER_VNODE,
+                                          flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                                          fflags=watch_flags) for fd in fds], 0)
+                
+                while True:
+                    if self._log_is_complete(log_path):
+                        return log_path
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        return None
+                    wait = min(quiet_period, remaining)
+                    events = kq.control(None, len(fds), wait)
+                    if not events:
+                        if wait == quiet_period:
+                            return log_path
+                        continue
+                    if any(e.ident == fds[0] or e.fflags & (select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME)
+                           for e in events):
+                        # A log was added, replaced or moved: re-resolve and re-register
+                        log_path = self.get_latest_build_log() or log_path
+                        break
+        finally:
+            for fd in fds:
+                os.close(fd)
+            kq.close()
+    
+    def _poll_for_quiet_log(self, deadline: float) -> Optional[Path]:
+        """Poll the latest build log until it is complete or its mtime is stable for 3 seconds. Returns the log, or None on timeout"""
         last_modified = 0
         stable_count = 0
         
-        while time.time() - start_time < timeout:
-            current_log = self.get_latest_build_log()
-            if current_log:
-                current_modified = current_log.stat().st_mtime
+        while time.time() < deadline:
+            current = self._find_latest_build_log()
+            if current:
+                current_log, current_modified = current
+                if self._log_is_complete(current_log):
+                    return current_log
                 if current_modified == last_modified:
                     stable_count += 1
                     if stable_count >= 3:  # File hasn't changed for 3 seconds
-                        print("Build completed")
-                        # Check if build was successful by parsing the log
-                        results = self.parse_build_log(current_log)
-                        build_success = len(results["errors"]) == 0
-                        return True, build_success
+                        return current_log
                 else:
                     last_modified = current_modified
                     stable_count = 0
             
             time.sleep(1)
         
-        print("Timeout waiting for build completion")
-        return False, False
+        return None
+    
+    def _log_is_complete(self, log_path: Path) -> bool:
+        """Check whether the build log's gzip stream has ended with a valid trailer"""
+        # Feed only the bytes appended since the last check to a persistent gzip decompressor;
+        # it reaches eof once the trailer's CRC and size have been read and verified. Logs are a
+        # single gzip member (see _iter_log_lines), so the first trailer is the end of the log
+        if not self._log_inflater or self._log_inflater[0] != log_path:
+            self._log_inflater = (log_path, None, 0, zlib.decompressobj(16 + zlib.MAX_WBITS))
+        _, last_seen, offset, inflater = self._log_inflater
+        
+        try:
+            with open(log_path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                seen = (st.st_ino, st.st_mtime_ns, st.st_size)
+                # Start over if the log was replaced, shrank, or changed at all after its trailer
+                if (last_seen and seen[0] != last_seen[0]) or st.st_size < offset or \
+                        (inflater.eof and seen != last_seen):
+                    offset, inflater = 0, zlib.decompressobj(16 + zlib.MAX_WBITS)
+                f.seek(offset)
+                while not inflater.eof:
+                    chunk = f.read(1 << 20)
+                    if not chunk:
+                        break
+                    offset += len(chunk)
+                    inflater.decompress(chunk)
+        except (OSError, zlib.error):
+            self._log_inflater = None
+            return False
+        
+        self._log_inflater = (log_path, seen, offset, inflater)
+        return inflater.eof
     
     def parse_build_log(self, log_path: Path) -> Dict[str, List[str]]:
         """Parse the xcactivitylog file for errors and warnings"""
-        result = {"errors": set(), "warnings": set(), "notes": set()}
+        result = {"errors": {}, "warnings": {}, "notes": {}}
         
         # Read the gzipped log file directly (xcrun xcactivitylog often fails)
         try:
-            with gzip.open(log_path, 'rt', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                # Look for error patterns in raw content
-                lines = content.split('\n')
-                for line in lines:
-                    # Standard error format with explicit "error:"
-                    if 'error:' in line.lower():
-                        file_error_match = re.search(r'(/[^:]+\.(?:swift|c(?:pp)?|h|mm?)):\d+:\d+.*?error:\s*(.+)', line, re.IGNORECASE)
-                        if file_error_match:
-                            error_msg = f"{file_error_match.group(1)}:{file_error_match.group(2).strip()}"
-                            result["errors"].add(error_msg)
-                        else:
-                            # Handle simple error format for Swift and ObjC files: /path/file.ext:error message
-                            simple_error_match = re.search(r'(/[^:]+\.(?:swift|c(?:pp)?|h|mm?)):(.+)', line, re.IGNORECASE)
-                            if simple_error_match:
-                                file_path = simple_error_match.group(1)
-                                message_part = simple_error_match.group(2)
-                                # Clean up the message - extract just the error after the last file path
-                                # Look for the actual error message pattern
-                                error_msg_match = re.search(r'.*'+re.escape(file_path)+r':(.+?)(?:\s*$)', message_part)
-                                if error_msg_match:
-                                    clean_message = error_msg_match.group(1).strip()
-                                else:
-                                    # Fallback: just take everything after the colon, clean up quotes
-                                    clean_message = message_part.strip()
-                                    clean_message = re.sub(r'.*"([^"]+)".*', r'\1', clean_message)
-                                    if '"' not in clean_message:  # If no quotes found, keep original
-                                        clean_message = message_part.strip()
-                                if clean_message:
-                                    result["errors"].add(f"{file_path}:{clean_message}")
-                    
-                    # Swift compilation errors that don't use "error:" prefix (but limit processing)
-                    elif len(line) < 1000 and re.search(r'(/[^:]+\.swift):\d+:\d+\s+', line):
-                        # Check if this looks like a Swift error (common patterns)
-                        if any(pattern in line.lower() for pattern in [
-                            'cannot override', 'ambiguous use', 'overriding declaration', 'overriding property must be',
-                            'conflicts with', 'must be unwrapped', 'requires an \'override\' keyword',
-                            'getter for', 'setter for', 'value of optional type'
-                        ]):
-                            swift_match = re.search(r'(/[^:]+\.swift):(\d+):(\d+)\s+(.+)', line)
-                            if swift_match:
-                                file_path, line_num, col_num, message = swift_match.groups()
-                                clean_message = message.strip()[:200]  # Limit message length
-                                result["errors"].add(f"{file_path}:{line_num}:{col_num} {clean_message}")
-                    
-                    # Objective-C errors (but limit processing)
-                    elif len(line) < 1000 and re.search(r'(/[^:]+\.mm?):\d+:\d+\s+', line):
-                        if any(pattern in line.lower() for pattern in [
-                            'property', 'not found', 'no visible @interface', 'declares the selector'
-                        ]):
-                            objc_match = re.search(r'(/[^:]+\.mm?):(\d+):(\d+)\s+(.+)', line)
-                            if objc_match:
-                                file_path, line_num, col_num, message = objc_match.groups()
-                                clean_message = message.strip()[:200]  # Limit message length
-                                result["errors"].add(f"{file_path}:{line_num}:{col_num} {clean_message}")
-                    
-                    # Warning format
-                    elif 'warning:' in line.lower():
-                        file_warning_match = re.search(r'(/[^:]+\.(?:swift|c(?:pp)?|h|mm?)):\d+:\d+.*?warning:\s*(.+)', line, re.IGNORECASE)
-                        if file_warning_match:
-                            warning_msg = f"{file_warning_match.group(1)}:{file_warning_match.group(2).strip()}"
-                            result["warnings"].add(warning_msg)
-                    
-                    # Note format
-                    elif 'note:' in line.lower():
-                        note_match = re.search(r'note:\s*(.+)', line, re.IGNORECASE)
-                        if note_match:
-                            result["notes"].add(note_match.group(1).strip())
+            # Stream lines so decompression and scanning never hold the whole log in memory
+            lines = _iter_log_lines(log_path)
+            if (os.cpu_count() or 1) > 2 and os.path.getsize(log_path) > _PARALLEL_MIN_LOG_SIZE:
+                _scan_log_parallel(lines, result)
+            else:
+                _scan_log_lines(lines, result)
         except Exception as read_error:
             print(f"Failed to read log file: {read_error}")
         
-        # Convert sets back to lists for consistency
+        # Convert to lists in order of first appearance
         return {
             "errors": list(result["errors"]),
             "warnings": list(result["warnings"]),
@@ -230,66 +596,48 @@ class XcodeRemote:
     
     def build(self, action: str = "build", target: Optional[str] = None, timeout: int = 300) -> bool:
         """Execute the complete build workflow"""
-        # Check if Xcode is already active
-        get_current_app = '''
-        tell application "System Events"
-            set frontApp to name of first application process whose frontmost is true
-            return frontApp
-        end tell
-        '''
-        
-        try:
-            result = subprocess.run(['osascript', '-e', get_current_app], capture_output=True, text=True, check=True)
-            current_app = result.stdout.strip()
-            xcode_already_active = (current_app == "Xcode")
-        except:
-            xcode_already_active = False
-        
-        if not xcode_already_active:
-            print(f"Opening project: {self.project_path}")
-            if not self.open_project_in_xcode():
-                return False
-        
         print(f"Triggering {action}...")
         if not self.trigger_build(action, target):
             return False
         
-        completed, build_success = self.wait_for_build_completion(timeout)
+        completed, _, log_path, results = self.wait_for_build_completion(timeout)
         if not completed:
             return False
         
-        # Parse the results from the build log
-        log_path = self.get_latest_build_log()
-        if log_path:
-            print(f"\nParsing build log: {log_path}")
-            results = self.parse_build_log(log_path)
-            
-            if results["errors"]:
-                print("\n🔴 ERRORS:")
-                for error in results["errors"]:
-                    print(f"  • {error}")
-            
-            if results["warnings"]:
-                print("\n🟡 WARNINGS:")
-                for warning in results["warnings"]:
-                    print(f"  • {warning}")
-            
-            
-            if results["errors"]:
-                print(f"\n❌ BUILD FAILED ({len(results['errors'])} errors)")
-                return False
-            elif results["warnings"]:
-                print(f"\n⚠️  BUILD COMPLETED WITH WARNINGS ({len(results['warnings'])} warnings)")
-                return True
-            else:
-                print("\n✅ BUILD SUCCESSFUL")
-                return True
+        # Report the results already parsed from the build log
+        print(f"\nBuild log: {log_path}")
+        
+        if results["errors"]:
+            print("\n🔴 ERRORS:")
+            for error in results["errors"]:
+                print(f"  • {error}")
+        
+        if results["warnings"]:
+            print("\n🟡 WARNINGS:")
+            for warning in results["warnings"]:
+                print(f"  • {warning}")
+        
+        
+        if results["errors"]:
+            print(f"\n❌ BUILD FAILED ({len(results['errors'])} errors)")
+            return False
+        elif results["warnings"]:
+            print(f"\n⚠️  BUILD COMPLETED WITH WARNINGS ({len(results['warnings'])} warnings)")
+            return True
         else:
-            print("No build log found")
-            return build_success
+            print("\n✅ BUILD SUCCESSFUL")
+            return True
 
+@functools.lru_cache(maxsize=1)
 def check_accessibility_permissions():
     """Check if accessibility permissions are granted"""
+    # A recent successful check is remembered on disk so quick re-runs skip the osascript probe
+    try:
+        if time.time() - _ACCESSIBILITY_CACHE_FILE.stat().st_mtime < _ACCESSIBILITY_CACHE_TTL:
+            return True
+    except OSError:
+        pass
+    
     test_script = '''
     tell application "System Events"
         return true
@@ -297,11 +645,16 @@ def check_accessibility_permissions():
     '''
     
     try:
-        subprocess.run(['osascript', '-e', test_script], 
-                      capture_output=True, text=True, check=True, timeout=5)
-        return True
+        _run_applescript(test_script, timeout=5)
     except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
         return False
+    
+    try:
+        _ACCESSIBILITY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _ACCESSIBILITY_CACHE_FILE.touch()
+    except OSError:
+        pass
+    return True
 
 def main():
     parser = argparse.ArgumentParser(description="Remote Xcode build tool")